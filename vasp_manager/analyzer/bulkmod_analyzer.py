@@ -2,12 +2,13 @@
 # Distributed under the terms of the MIT LICENSE
 
 import logging
+import os
 from pathlib import Path
 
 import numpy as np
 from pymatgen.analysis.eos import BirchMurnaghan
-from pymatgen.core import Structure
-from pymatgen.io.vasp import Vasprun
+
+from vasp_manager.utils import get_final_energy_from_vasprun, get_volume_from_poscar
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +52,12 @@ class BulkmodAnalyzer:
         """
         Fit an EOS to calculate the bulk modulus from a finished bulkmod calculation
         """
-        strain_paths = [path for path in calc_path.glob("strain*") if path.is_dir()]
+        with os.scandir(calc_path) as entries:
+            strain_paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("strain") and entry.is_dir()
+            ]
         strain_paths = sorted(strain_paths, key=lambda d: int(d.name.split("_")[-1]))
         volumes = []
         final_energies = []
@@ -62,14 +68,9 @@ class BulkmodAnalyzer:
             if len(vasprun_glob) == 0:
                 raise Exception(f"No vasprun.xml available at {strain_path}")
             vasprun_path = vasprun_glob[0]
-            volume = Structure.from_file(poscar_path).volume
-            vasprun = Vasprun(
-                filename=vasprun_path,
-                parse_dos=False,
-                parse_eigen=False,
-                parse_potcar_file=False,
-            )
-            final_energy = vasprun.final_energy
+            # only the lattice is needed, so skip parsing the whole structure
+            volume = get_volume_from_poscar(poscar_path)
+            final_energy = get_final_energy_from_vasprun(vasprun_path)
             volumes.append(volume)
             final_energies.append(final_energy)
         logger.debug(f"Volumes:\n\t{volumes}")
@@ -7,7 +7,7 @@ from pathlib import Path
 import numpy as np
 from pymatgen.core import Structure
 
-from vasp_manager.utils import pgrep
+from vasp_manager.utils import pgrep, read_structure
 
 
 class ElasticAnalyzer:
@@ -318,7 +318,7 @@ class ElasticAnalyzer:
         if not calc_dir.exists():
             raise ValueError(f"Could not set calc_dir to {calc_dir} as it does not exist")
 
-        structure = Structure.from_file(calc_dir / "POSCAR")
+        structure = read_structure(calc_dir / "POSCAR")
         outcar_glob = list(calc_dir.glob("OUTCAR*"))
         if len(outcar_glob) == 0:
             raise FileNotFoundError(f"No OUTCAR available in {calc_dir}")
@@ -11,7 +11,7 @@ import numpy as np
 
 from vasp_manager.analyzer.bulkmod_analyzer import BulkmodAnalyzer
 from vasp_manager.calculation_manager.base import BaseCalculationManager
-from vasp_manager.utils import LoggerAdapter, change_directory, pgrep
+from vasp_manager.utils import LoggerAdapter, pgrep
 from vasp_manager.vasp_input_creator import VaspInputCreator
 
 logger = logging.getLogger(__name__)
@@ -201,14 +201,16 @@ class BulkmodCalculationManager(BaseCalculationManager):
                 return "STOPPED"
             else:
                 return None
-        try:
-            ba = BulkmodAnalyzer(calc_path=self.calc_path)
-            self._results = ba.results
-            self.logger.info(f"{self.mode.upper()} Calculation: Success")
-            self.logger.info(f"BULK MODULUS: {ba.results.get('B')}")
-        except Exception as e:
-            self.logger.warning(e)
-            self._results = None
+        # fitting the EOS reads the vasprun.xml of every strain, so keep the fit
+        if self._results is None:
+            try:
+                ba = BulkmodAnalyzer(calc_path=self.calc_path)
+                self._results = ba.results
+                self.logger.info(f"{self.mode.upper()} Calculation: Success")
+                self.logger.info(f"BULK MODULUS: {ba.results.get('B')}")
+            except Exception as e:
+                self.logger.warning(e)
+                self._results = None
         return self._results
 
     def _make_bulkmod_strains(self):
@@ -240,9 +242,10 @@ class BulkmodCalculationManager(BaseCalculationManager):
             with open(strain_poscar_path, "w+") as fw:
                 fw.write("\n".join(strain_poscar))
 
-            with change_directory(strain_path):
-                for f in ["POTCAR", "INCAR"]:
-                    if Path(f).exists():
-                        os.remove(f)
-                    orig_path = Path("..") / f
-                    os.symlink(orig_path, f, target_is_directory=False)
+            for f in ["POTCAR", "INCAR"]:
+                strain_f_path = strain_path / f
+                if strain_f_path.exists():
+                    os.remove(strain_f_path)
+                # relative link to the file in calc_path
+                orig_path = Path("..") / f
+                os.symlink(orig_path, strain_f_path, target_is_directory=False)
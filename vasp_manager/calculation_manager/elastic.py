@@ -178,11 +178,13 @@ class ElasticCalculationManager(BaseCalculationManager):
                 return "STOPPED"
             else:
                 return None
-        try:
-            self._results = self._analyze_elastic()
-        except Exception as e:
-            self.logger.warning(e)
-            self._results = None
+        # keep the analyzed elastic tensor rather than re-reading it from disk
+        if self._results is None:
+            try:
+                self._results = self._analyze_elastic()
+            except Exception as e:
+                self.logger.warning(e)
+                self._results = None
         return self._results
 
     def _analyze_elastic(self):
@@ -4,10 +4,8 @@
 import logging
 from functools import cached_property
 
-from pymatgen.core import Structure
-
 from vasp_manager.calculation_manager.base import BaseCalculationManager
-from vasp_manager.utils import LoggerAdapter, pgrep, ptail
+from vasp_manager.utils import LoggerAdapter, get_n_atoms_from_poscar, pgrep, ptail
 from vasp_manager.vasp_input_creator import VaspInputCreator
 
 logger = logging.getLogger(__name__)
@@ -156,7 +154,7 @@ class StaticCalculationManager(BaseCalculationManager):
 
         self._results = {}
         final_energy = float(grep_output[0].split()[2])
-        num_atoms = len(Structure.from_file(self.calc_path / "POSCAR"))
+        num_atoms = get_n_atoms_from_poscar(self.calc_path / "POSCAR")
         magmom_per_atom = self._parse_magmom_per_atom()
         self._results["final_energy"] = final_energy
         self._results["final_energy_pa"] = final_energy / num_atoms
@@ -7,7 +7,7 @@ import subprocess
 from functools import cached_property
 from pathlib import Path
 
-from vasp_manager.utils import LoggerAdapter, change_directory
+from vasp_manager.utils import LoggerAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -125,16 +125,17 @@ class JobManager:
             return False
 
         submission_call = f"sbatch {self.exe_name}"
-        with change_directory(self.calc_path):
-            submission_call_output = (
-                subprocess.check_output(submission_call, shell=True)
-                .decode("utf-8")
-                .strip()
-            )
-            jobid = submission_call_output.split(" ")[3]
-            self.jobid = jobid
-            with open(self.jobid_name, "w+") as fw:
-                fw.write(f"{jobid}\n")
+        # run sbatch from calc_path without changing the working directory of
+        # this process, which is shared by all threads
+        submission_call_output = (
+            subprocess.check_output(submission_call, shell=True, cwd=self.calc_path)
+            .decode("utf-8")
+            .strip()
+        )
+        jobid = submission_call_output.split(" ")[3]
+        self.jobid = jobid
+        with open(self.calc_path / self.jobid_name, "w+") as fw:
+            fw.write(f"{jobid}\n")
         self.logger.info(f"Submitted job {jobid}")
         return True
 
@@ -1,21 +1,33 @@
+import bz2
+import gzip
 import json
+import os
 import shutil
 from pathlib import Path
 
 import importlib_resources
 import numpy as np
+import pytest
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Structure
+from pymatgen.io.vasp import Vasprun
 
+import vasp_manager.utils
 from vasp_manager.utils import (
     NumpyEncoder,
     change_directory,
+    get_final_energy_from_vasprun,
+    get_n_atoms_from_poscar,
     get_pmg_structure_from_poscar,
+    get_volume_from_poscar,
     make_potcar_anonymous,
     pcat,
     pgrep,
     phead,
     ptail,
+    read_json,
+    read_structure,
+    write_json,
 )
 
 input_string = """\
@@ -40,6 +52,50 @@ def test_numpy_encoder(tmp_path):
         json.dump(data, fw, indent=2, cls=NumpyEncoder)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_write_json(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(vasp_manager.utils, "orjson", None)
+    data = {
+        "material": {
+            "rlx": {"total_dV": np.round(np.float64(0.01234), 4), "dE": 1e-05},
+            "elastic": {"elastic_tensor": np.eye(6)},
+            "bulkmod": {"strains": np.eye(6)[:, ::2], 1: None},
+            "static": {"unstable": np.bool_(False), "n_atoms": np.int64(2)},
+            "note": "a = 5.64 \u00c5",
+        }
+    }
+    # orjson and json format some floats and non-ASCII text differently, but
+    # both write the same data
+    expected_data = json.loads(json.dumps(data, cls=NumpyEncoder))
+    json_path = tmp_path / "data.json"
+    write_json(data, json_path)
+    with open(json_path, encoding="utf-8") as fr:
+        json_str = fr.read()
+    assert json_str.startswith('{\n  "material": {\n    "rlx": {')
+    loaded_data = read_json(json_path)
+    assert loaded_data == expected_data
+    assert loaded_data["material"]["rlx"]["total_dV"] == 0.0123
+    assert loaded_data["material"]["elastic"]["elastic_tensor"] == np.eye(6).tolist()
+
+    write_json(data, json_path, compact=True)
+    with open(json_path, encoding="utf-8") as fr:
+        json_str = fr.read()
+    assert json_str.startswith('{"material":{"rlx":{"total_dV":0.0123,')
+    assert read_json(json_path) == expected_data
+
+    # non-finite floats, e.g. sound velocities of elastically unstable materials
+    data["material"]["elastic"]["vs"] = np.float64(np.nan)
+    data["material"]["elastic"]["vt"] = [np.inf, 1.0]
+    write_json(data, json_path)
+    with open(json_path, encoding="utf-8") as fr:
+        json_str = fr.read()
+    assert '"vs": NaN' in json_str and "Infinity" in json_str
+    loaded_data = read_json(json_path)
+    assert np.isnan(loaded_data["material"]["elastic"]["vs"])
+    assert loaded_data["material"]["elastic"]["vt"] == [np.inf, 1.0]
+
+
 def test_pmg_structure(tmp_path):
     # original unsymmetrized structure
     orig_poscar_path = importlib_resources.files("vasp_manager").joinpath(
@@ -146,3 +202,115 @@ def test_make_potcar_anonymous(tmp_path):
     with open(new_potcar_path) as fr:
         anon_potcar_text = fr.read()
     assert anon_potcar_text == "PAW_PBE P 17Jan2003\nPAW_PBE Pb_d 06Sep2000"
+
+
+def test_get_n_atoms_from_poscar(tmp_path):
+    calculations_folder = Path(
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    for poscar_path in calculations_folder.glob("*/POSCAR"):
+        n_atoms = len(Structure.from_file(poscar_path))
+        assert get_n_atoms_from_poscar(poscar_path) == n_atoms
+
+        # POSCAR without the line of species names
+        with open(poscar_path) as fr:
+            poscar_lines = fr.read().splitlines()
+        del poscar_lines[5]
+        vasp4_poscar_path = tmp_path / "POSCAR"
+        with open(vasp4_poscar_path, "w+") as fw:
+            fw.write("\n".join(poscar_lines))
+        assert get_n_atoms_from_poscar(vasp4_poscar_path) == n_atoms
+
+
+def test_read_structure(tmp_path):
+    orig_poscar_path = importlib_resources.files("vasp_manager").joinpath(
+        str(Path("tests") / "calculations" / "material" / "POSCAR")
+    )
+    poscar_path = tmp_path / "POSCAR"
+    shutil.copy(orig_poscar_path, poscar_path)
+
+    structure = read_structure(poscar_path)
+    assert structure == Structure.from_file(poscar_path)
+    # modifying the returned structure doesn't affect later reads
+    structure.remove_sites([0])
+    assert len(read_structure(poscar_path)) == 2
+
+    # rewriting the POSCAR is picked up
+    structure.to(filename=str(poscar_path), fmt="poscar")
+    assert len(read_structure(poscar_path)) == 1
+
+    # as is a same-size rewrite that keeps the modification time
+    shutil.copy(orig_poscar_path, poscar_path)
+    assert len(read_structure(poscar_path)) == 2
+    poscar_stat = poscar_path.stat()
+    with open(poscar_path) as fr:
+        poscar_str = fr.read()
+    with open(poscar_path, "w") as fw:
+        fw.write(poscar_str.replace("0.50000000 0.50000000", "0.25000000 0.25000000"))
+    os.utime(poscar_path, ns=(poscar_stat.st_atime_ns, poscar_stat.st_mtime_ns))
+    assert poscar_path.stat().st_size == poscar_stat.st_size
+    assert read_structure(poscar_path)[0].frac_coords[0] == 0.25
+
+
+def test_get_volume_from_poscar(tmp_path):
+    calculations_folder = Path(
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    for poscar_path in calculations_folder.glob("**/POSCAR"):
+        volume = Structure.from_file(poscar_path).volume
+        assert np.isclose(get_volume_from_poscar(poscar_path), volume)
+
+    # negative scaling factors set the volume directly
+    with open(poscar_path) as fr:
+        poscar_lines = fr.read().splitlines()
+    poscar_lines[1] = "-100.0"
+    volume_poscar_path = tmp_path / "POSCAR"
+    with open(volume_poscar_path, "w+") as fw:
+        fw.write("\n".join(poscar_lines))
+    assert get_volume_from_poscar(volume_poscar_path) == 100.0
+
+
+def test_get_final_energy_from_vasprun():
+    calculations_folder = Path(
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    for calc_dir in ["static", "rlx", "bulkmod/strain_0"]:
+        calc_path = calculations_folder / "material_spinu" / calc_dir
+        vasprun_path = calc_path / "vasprun.xml.gz"
+        vasprun = Vasprun(vasprun_path, parse_dos=False, parse_eigen=False)
+        assert get_final_energy_from_vasprun(vasprun_path) == vasprun.final_energy
+
+
+def test_get_final_energy_from_compressed_vasprun(tmp_path):
+    calculations_folder = Path(
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    vasprun_path = calculations_folder / "material_spinu" / "static" / "vasprun.xml.gz"
+    final_energy = get_final_energy_from_vasprun(vasprun_path)
+    with gzip.open(vasprun_path, "rb") as fr:
+        vasprun_bytes = fr.read()
+
+    # the file extension decides the compression, not the rest of the path
+    calc_path = tmp_path / "run.gz"
+    calc_path.mkdir()
+    with open(calc_path / "vasprun.xml", "wb") as fw:
+        fw.write(vasprun_bytes)
+    with bz2.open(calc_path / "vasprun.xml.bz2", "wb") as fw:
+        fw.write(vasprun_bytes)
+    assert get_final_energy_from_vasprun(calc_path / "vasprun.xml") == final_energy
+    assert get_final_energy_from_vasprun(calc_path / "vasprun.xml.bz2") == final_energy
+
+
+def test_get_final_energy_from_truncated_vasprun(tmp_path):
+    calculations_folder = Path(
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    vasprun_path = calculations_folder / "material_spinu" / "static" / "vasprun.xml.gz"
+    with gzip.open(vasprun_path, "rt") as fr:
+        vasprun_str = fr.read()
+    # e.g. the job was killed while writing vasprun.xml
+    truncated_path = tmp_path / "vasprun.xml"
+    with open(truncated_path, "w+") as fw:
+        fw.write(vasprun_str[: int(0.97 * len(vasprun_str))])
+    with pytest.raises(ValueError):
+        get_final_energy_from_vasprun(truncated_path)
@@ -1,7 +1,11 @@
+import json
+import os
 import shutil
 from textwrap import dedent
 
 import importlib_resources
+import numpy as np
+import pytest
 
 from vasp_manager import VaspManager
 
@@ -124,7 +128,8 @@ def test_vmg_in_order(tmp_path):
         assert summary["n_total"] == summary[calculation_type]["n_finished"]
 
 
-def test_vmg_with_skipping(tmp_path):
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_vmg_with_skipping(tmp_path, executor):
     original_calculation_folder = (
         importlib_resources.files("vasp_manager") / "tests" / "calculations"
     )
@@ -159,6 +164,7 @@ def test_vmg_with_skipping(tmp_path):
         calculation_types=calculation_types,
         material_paths=material_paths,
         use_multiprocessing=True,
+        executor=executor,
         to_rerun=True,
         to_submit=True,
     )
@@ -186,3 +192,314 @@ def test_vmg_with_skipping(tmp_path):
                 assert summary[pc]["n_finished"] == 0
             case _:
                 raise Exception
+
+
+@pytest.mark.parametrize("use_multiprocessing", [False, True])
+def test_vmg_from_scratch_only_once(tmp_path, use_multiprocessing):
+    original_calculation_folder = (
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    temp_calculation_folder = tmp_path / "calculations"
+    shutil.copytree(
+        original_calculation_folder,
+        temp_calculation_folder,
+        dirs_exist_ok=True,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(
+            "material_hit_errors",
+            "material_needs_archive",
+            "material_needs_rerun",
+        ),
+    )
+
+    vmg = VaspManager(
+        calculation_types=["rlx-coarse", "rlx", "static"],
+        material_paths=str(temp_calculation_folder),
+        use_multiprocessing=use_multiprocessing,
+        calculation_manager_kwargs={"static": {"from_scratch": True}},
+    )
+    vmg.run_calculations()
+    static_paths = [
+        temp_calculation_folder / material_name / "static"
+        for material_name in vmg.material_names
+    ]
+    for static_path in static_paths:
+        assert not (static_path / "vasprun.xml.gz").exists()
+        (static_path / "marker").touch()
+
+    # the static calculations were already restarted, so they aren't removed again
+    vmg.run_calculations()
+    for static_path in static_paths:
+        assert (static_path / "marker").exists()
+
+
+def test_vmg_summary_from_results(tmp_path):
+    original_calculation_folder = (
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    temp_calculation_folder = tmp_path / "calculations"
+    shutil.copytree(
+        original_calculation_folder,
+        temp_calculation_folder,
+        dirs_exist_ok=True,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(
+            "rlx*",
+            "static",
+            "bulkmod",
+            "elastic",
+            "material_hit_errors",
+            "material_needs_archive",
+            "material_needs_rerun",
+        ),
+    )
+
+    calculation_types = ["rlx-coarse", "rlx", "static"]
+    vmg = VaspManager(
+        calculation_types=calculation_types,
+        material_paths=str(temp_calculation_folder),
+    )
+    # results written after instantiation should still be summarized
+    results = {
+        "material": {
+            "rlx-coarse": "done",
+            "rlx": {"total_dV": 0.01},
+            "static": "STOPPED",
+        },
+        "material_spinu": {"rlx-coarse": "not finished"},
+    }
+    with open(vmg.results_path, "w+") as fw:
+        json.dump(results, fw)
+
+    summary = vmg.summary(as_string=False)
+    assert summary["n_total"] == 2
+    assert summary["rlx-coarse"]["finished"] == ["material"]
+    assert summary["rlx"]["finished"] == ["material"]
+    assert summary["rlx"]["unfinished"] == ["material_spinu"]
+    assert summary["static"]["n_finished"] == 0
+    assert summary["static"]["stopped"] == ["material"]
+    assert summary["static"]["unfinished"] == ["material", "material_spinu"]
+
+    summary_str = vmg.summary()
+    assert vmg.summary() is summary_str
+    # rewriting results.json invalidates the cached summary
+    results["material"]["static"] = {"total_energy": -1.0}
+    with open(vmg.results_path, "w+") as fw:
+        json.dump(results, fw)
+    assert vmg.summary() != summary_str
+    assert "STATIC      1/2 completed" in vmg.summary()
+
+    # as do writes through another VaspManager within the same mtime tick
+    summary_str = vmg.summary()
+    other_vmg = VaspManager(
+        calculation_types=calculation_types,
+        material_paths=str(temp_calculation_folder),
+    )
+    other_vmg.results["material_spinu"]["rlx-coarse"] = "done"
+    other_vmg._write_results()
+    mtime = vmg._results_file_key[2]
+    os.utime(vmg.results_path, ns=(mtime, mtime))
+    assert "RLX-COARSE  2/2 completed" in vmg.summary()
+
+    vmg.results["material"]["static"] = None
+    assert vmg.refresh_results() == other_vmg.results
+
+
+def test_vmg_skips_unchanged_results(tmp_path):
+    original_calculation_folder = (
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    temp_calculation_folder = tmp_path / "calculations"
+    shutil.copytree(
+        original_calculation_folder,
+        temp_calculation_folder,
+        dirs_exist_ok=True,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(
+            "material_hit_errors",
+            "material_needs_archive",
+            "material_needs_rerun",
+        ),
+    )
+
+    calculation_types = ["rlx-coarse", "rlx", "static"]
+    vmg = VaspManager(
+        calculation_types=calculation_types,
+        material_paths=str(temp_calculation_folder),
+    )
+    vmg.run_calculations()
+    assert not (temp_calculation_folder / "results.json.tmp").exists()
+    mtime = vmg.results_path.stat().st_mtime_ns
+
+    vmg = VaspManager(
+        calculation_types=calculation_types,
+        material_paths=str(temp_calculation_folder),
+    )
+    results = vmg.run_calculations()
+    assert vmg.results_path.stat().st_mtime_ns == mtime
+    # finished materials are never dispatched, so no managers are created
+    assert vmg._calculation_managers == {}
+    for material in results:
+        assert results[material]["rlx-coarse"] == "done"
+
+
+def test_vmg_skips_unchanged_unfinished_results(tmp_path):
+    original_calculation_folder = (
+        importlib_resources.files("vasp_manager") / "tests" / "calculations"
+    )
+    temp_calculation_folder = tmp_path / "calculations"
+    # skip static so it is still unfinished after each run
+    shutil.copytree(
+        original_calculation_folder,
+        temp_calculation_folder,
+        dirs_exist_ok=True,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(
+            "static",
+            "material_hit_errors",
+            "material_needs_archive",
+            "material_needs_rerun",
+        ),
+    )
+
+    vmg = VaspManager(
+        calculation_types=["rlx-coarse", "rlx", "static"],
+        material_paths=str(temp_calculation_folder),
+        use_multiprocessing=False,
+    )
+    results = vmg.run_calculations()
+    for material in results:
+        assert results[material]["static"] is None
+    results_file_key = vmg._get_results_file_key()
+
+    # the unfinished static calculations return the same results again
+    vmg.run_calculations()
+    assert vmg._get_results_file_key() == results_file_key
+
+
+def test_vmg_calculation_types(tmp_path):
+    material_paths = [tmp_path / "material"]
+    vmg = VaspManager(
+        calculation_types=["static", "rlx", "rlx-coarse", "rlx"],
+        material_paths=material_paths,
+    )
+    assert vmg.calculation_types == ["rlx-coarse", "rlx", "static"]
+
+    with pytest.raises(ValueError):
+        VaspManager(calculation_types=["rlx", "phonon"], material_paths=material_paths)
+    with pytest.raises(Exception):
+        VaspManager(calculation_types=["elastic"], material_paths=material_paths)
+
+
+def test_vmg_start_method(tmp_path):
+    material_paths = [tmp_path / "material"]
+    vmg = VaspManager(
+        calculation_types=["rlx-coarse"],
+        material_paths=material_paths,
+        start_method="spawn",
+    )
+    assert vmg.start_method == "spawn"
+
+    with pytest.raises(ValueError):
+        VaspManager(
+            calculation_types=["rlx-coarse"],
+            material_paths=material_paths,
+            start_method="not_a_start_method",
+        )
+    with pytest.raises(ValueError):
+        VaspManager(
+            calculation_types=["rlx-coarse"],
+            material_paths=material_paths,
+            executor="not_an_executor",
+        )
+
+
+def test_vmg_pending_calculation_types(tmp_path):
+    vmg = VaspManager(
+        calculation_types=["rlx-coarse", "rlx", "static"],
+        material_paths=[tmp_path / "material"],
+        calculation_manager_kwargs={"static": {"from_scratch": True}},
+    )
+    vmg.results["material"] = {"rlx-coarse": "done", "rlx": "not finished", "static": 1.0}
+    assert vmg._get_pending_calculation_types("material") == ["rlx", "static"]
+    assert vmg._needs_calculations("material")
+    assert vmg._check_calc_by_result("material", "static") == (True, False)
+    with pytest.raises(ValueError, match="phonon"):
+        vmg._check_calc_by_result("material", "phonon")
+
+
+def test_vmg_material_paths_array(tmp_path):
+    material_paths = np.array([str(tmp_path / "b"), str(tmp_path / "a")])
+    vmg = VaspManager(calculation_types=["rlx"], material_paths=material_paths)
+    assert vmg.material_names == ["a", "b"]
+    assert vmg.base_path == tmp_path
+
+
+def test_vmg_dispatch_order(tmp_path):
+    material_paths = []
+    for n_atoms in range(1, 11):
+        material_path = tmp_path / f"material_{n_atoms:02d}"
+        material_path.mkdir()
+        with open(material_path / "POSCAR", "w+") as fw:
+            fw.write(f"Si\n1.0\n1 0 0\n0 1 0\n0 0 1\nSi\n{n_atoms}\nDirect\n")
+        material_paths.append(material_path)
+    vmg = VaspManager(calculation_types=["rlx"], material_paths=material_paths)
+
+    by_size = [f"material_{n_atoms:02d}" for n_atoms in range(10, 0, -1)]
+    assert vmg._get_dispatch_order(vmg.material_names) == by_size
+    # each chunk of 3 starts with one of the largest materials
+    ordered_names = vmg._get_dispatch_order(vmg.material_names, chunksize=3)
+    chunks = [ordered_names[i : i + 3] for i in range(0, 10, 3)]
+    assert chunks == [
+        [by_size[0], by_size[4], by_size[7]],
+        [by_size[1], by_size[5], by_size[8]],
+        [by_size[2], by_size[6], by_size[9]],
+        [by_size[3]],
+    ]
+
+
+def test_vmg_calculation_manager_kwargs(tmp_path):
+    material_paths = [tmp_path / "material"]
+    calculation_manager_kwargs = {"rlx": {"primitive": False}}
+    vmg = VaspManager(
+        calculation_types=["rlx", "static"],
+        material_paths=material_paths,
+        calculation_manager_kwargs=calculation_manager_kwargs,
+    )
+    assert vmg.calculation_manager_kwargs == {"rlx": {"primitive": False}, "static": {}}
+    assert calculation_manager_kwargs == {"rlx": {"primitive": False}}
+
+    # the default kwargs aren't shared between instances
+    vmg = VaspManager(calculation_types=["elastic", "rlx"], material_paths=material_paths)
+    assert vmg.calculation_manager_kwargs == {"rlx": {}, "elastic": {}}
+    vmg = VaspManager(calculation_types=["static"], material_paths=material_paths)
+    assert vmg.calculation_manager_kwargs == {"static": {}}
+
+
+def test_vmg_shared_manager_kwargs(tmp_path):
+    material_path = tmp_path / "material"
+    vmg = VaspManager(
+        calculation_types=["bulkmod", "rlx"], material_paths=[material_path], tail=10
+    )
+    shared_kwargs = vmg._get_shared_manager_kwargs("rlx")
+    assert shared_kwargs["tail"] == 10
+    assert not shared_kwargs["from_coarse_relax"]
+    # the shared kwargs are built once, not for every material
+    assert vmg._get_shared_manager_kwargs("rlx") is shared_kwargs
+    rlx_manager, bulkmod_manager = vmg._get_calculation_managers(material_path)
+    assert rlx_manager.tail == 10
+    assert bulkmod_manager.tail == 5
+    assert bulkmod_manager.from_relax
+
+    vmg.calculation_types = ["rlx-coarse", "rlx"]
+    assert vmg._get_shared_manager_kwargs("rlx")["from_coarse_relax"]
+
+
+def test_vmg_default_ncore(tmp_path, monkeypatch):
+    material_paths = [tmp_path / f"material_{i}" for i in range(8)]
+    vmg = VaspManager(calculation_types=["rlx"], material_paths=material_paths[:2])
+    assert vmg.ncore <= 2
+
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+    vmg = VaspManager(calculation_types=["rlx"], material_paths=material_paths)
+    assert vmg.ncore == 3
@@ -7,12 +7,19 @@ import logging
 import os
 from collections import deque
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
+from monty.io import zopen
 from pymatgen.core import Structure
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @contextmanager
 def change_directory(new_dir):
@@ -32,11 +39,121 @@ class NumpyEncoder(json.JSONEncoder):
             return int(obj)
         elif isinstance(obj, np.floating):
             return float(obj)
+        elif isinstance(obj, np.bool_):
+            return bool(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
         return json.JSONEncoder.default(self, obj)
 
 
+def _to_builtin(obj):
+    """
+    Recursively converts numpy types in obj to their builtin python equivalents
+
+    Args:
+        obj: object to convert, which may contain numpy types
+    Returns:
+        builtin_obj: obj with numpy scalars and arrays replaced by python
+            scalars and lists
+    """
+    if isinstance(obj, dict):
+        return {key: _to_builtin(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_to_builtin(value) for value in obj]
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def _has_non_finite(obj):
+    """
+    Recursively checks obj for NaN or infinite floats
+
+    Args:
+        obj: object to check, which may contain numpy types
+    Returns:
+        has_non_finite (bool): True if any float in obj is NaN or infinite
+    """
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    elif isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "O":
+            return _has_non_finite(obj.tolist())
+        return obj.dtype.kind == "f" and not np.isfinite(obj).all()
+    elif isinstance(obj, (float, np.floating)):
+        return not np.isfinite(obj)
+    return False
+
+
+def read_json(file_name):
+    """
+    Read a json file, using orjson if it is installed
+
+    Args:
+        file_name (str | Path): path of json file
+    Returns:
+        data (dict | list): parsed json
+    """
+    if orjson is not None:
+        with open(file_name, "rb") as fr:
+            json_bytes = fr.read()
+        try:
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN and Infinity that json writes for
+            # non-finite floats, so let json parse those files
+            return json.loads(json_bytes)
+    # orjson writes non-ASCII characters as UTF-8
+    with open(file_name, encoding="utf-8") as fr:
+        data = json.load(fr)
+    return data
+
+
+def write_json(data, file_name, compact=False):
+    """
+    Write data to a json file, using orjson if it is installed
+
+    Both backends write the same data, but the text can differ: orjson writes
+    some floats differently (e.g. 0.00001 instead of 1e-05) and writes
+    non-ASCII characters as UTF-8 instead of escaping them
+
+    Args:
+        data (dict | list): data to write, which may contain numpy types
+        file_name (str | Path): path of json file
+        compact (bool): if True, write without indentation or extra whitespace
+            else, indent with 2 spaces
+    Returns:
+        None
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        # orjson hands numpy objects it can't serialize natively (e.g.
+        # non-contiguous arrays) to NumpyEncoder, and stringifies non-str keys
+        # like json does
+        json_bytes = orjson.dumps(data, default=NumpyEncoder().default, option=option)
+        # orjson writes NaN and Infinity as null, so only keep its output if
+        # there are no non-finite floats, which json writes as NaN and Infinity
+        if b"null" not in json_bytes or not _has_non_finite(data):
+            with open(file_name, "wb") as fw:
+                fw.write(json_bytes)
+            return
+
+    if compact:
+        json_kwargs = {"separators": (",", ":")}
+    else:
+        json_kwargs = {"indent": 2}
+    # convert numpy types in a single pass up front rather than through an
+    # encoder callback for each one, then stream to the file
+    with open(file_name, "w+") as fw:
+        json.dump(_to_builtin(data), fw, **json_kwargs)
+
+
 class LoggerAdapter(logging.LoggerAdapter):
     def __init__(self, logger, prefix, separator=" -- "):
         super(LoggerAdapter, self).__init__(logger, {})
@@ -47,6 +164,35 @@ class LoggerAdapter(logging.LoggerAdapter):
         return f"{self.prefix}{self.separator}{msg}", kwargs
 
 
+@lru_cache(maxsize=128)
+def _read_structure(poscar_path, file_key):
+    return Structure.from_file(poscar_path)
+
+
+def read_structure(poscar_path):
+    """
+    Reads a structure from a POSCAR, only parsing each version of the file once
+
+    Args:
+        poscar_path (str | Path)
+    Returns:
+        structure (pmg.Structure): copy of the structure in POSCAR, which can be
+            modified freely
+    """
+    poscar_path = os.fspath(poscar_path)
+    # identify the version of the file, including same-size rewrites within
+    # one mtime tick (ctime) and atomic replacements (inode)
+    poscar_stat = os.stat(poscar_path)
+    file_key = (
+        poscar_stat.st_ino,
+        poscar_stat.st_size,
+        poscar_stat.st_mtime_ns,
+        poscar_stat.st_ctime_ns,
+    )
+    structure = _read_structure(poscar_path, file_key)
+    return structure.copy()
+
+
 def get_pmg_structure_from_poscar(
     poscar_path,
     to_process=True,
@@ -65,7 +211,7 @@ def get_pmg_structure_from_poscar(
     Returns:
         structure (pmg.Structure): structure from POSCAR
     """
-    structure = Structure.from_file(poscar_path)
+    structure = read_structure(poscar_path)
     if to_process:
         sga = SpacegroupAnalyzer(structure, symprec=symprec, angle_tolerance=-1.0)
         if primitive:
@@ -78,6 +224,122 @@ def get_pmg_structure_from_poscar(
     return structure
 
 
+def get_n_atoms_from_poscar(poscar_path):
+    """
+    Counts the atoms in a POSCAR without building a pymatgen Structure
+
+    Args:
+        poscar_path (str | Path)
+    Returns:
+        n_atoms (int): number of atoms in POSCAR
+    """
+    with open(poscar_path) as fr:
+        # only the header up to the atom counts is needed
+        header = [fr.readline() for _ in range(7)]
+    # VASP 5 POSCARs have a line of species names before the atom counts
+    atom_counts = header[5].split()
+    if not atom_counts[0].isdigit():
+        atom_counts = header[6].split()
+    return sum(int(atom_count) for atom_count in atom_counts)
+
+
+def get_volume_from_poscar(poscar_path):
+    """
+    Calculates the cell volume of a POSCAR without building a pymatgen Structure
+
+    Args:
+        poscar_path (str | Path)
+    Returns:
+        volume (float): cell volume in A^3
+    """
+    with open(poscar_path) as fr:
+        # only the scaling factor and lattice vectors are needed
+        header = [fr.readline() for _ in range(5)]
+    scaling_factors = [float(factor) for factor in header[1].split()]
+    lattice = np.array([line.split()[:3] for line in header[2:5]], dtype=float)
+    volume = abs(np.linalg.det(lattice))
+    if len(scaling_factors) == 3:
+        # separate scaling factors for each cartesian direction
+        return volume * np.prod(scaling_factors)
+    scaling_factor = scaling_factors[0]
+    if scaling_factor < 0:
+        # a negative scaling factor is the desired cell volume
+        return -scaling_factor
+    return volume * scaling_factor**3
+
+
+def _parse_vasprun_float(line):
+    # e.g. <i name="e_fr_energy">     -8.14779718 </i>
+    value = line.split(">", 1)[1].split("<", 1)[0]
+    try:
+        return float(value)
+    except ValueError:
+        # VASP writes overflowing numbers as ****
+        return float("nan")
+
+
+def get_final_energy_from_vasprun(vasprun_path):
+    """
+    Scans a vasprun.xml for the final energy without building a full
+    pymatgen Vasprun
+
+    Matches Vasprun.final_energy, including its fix for the wrong final
+    e_0_energy written by some VASP versions
+    (https://www.vasp.at/forum/viewtopic.php?f=3&t=16942)
+
+    Args:
+        vasprun_path (str | Path): path of vasprun.xml, which may be compressed
+    Returns:
+        final_energy (float): final energy in eV
+    Raises:
+        ValueError: if vasprun.xml is incomplete or has no final energy
+    """
+    energy_names = ("e_fr_energy", "e_0_energy")
+    # VASP writes each energy on its own line, so scan lines instead of parsing
+    # the xml, which is mostly eigenvalues and densities of states
+    in_scstep = False
+    # energies of the last ionic step and of the last electronic step
+    ionic_energies = {}
+    electronic_energies = {}
+    scstep_energies = {}
+    # a vasprun.xml is only complete once the root element is closed
+    is_complete = False
+    # zopen decompresses based on the file extension, like Vasprun
+    with zopen(vasprun_path, "rt", encoding="utf-8") as fr:
+        for line in fr:
+            if "_energy" in line:
+                for energy_name in energy_names:
+                    if f'"{energy_name}"' in line:
+                        energies = scstep_energies if in_scstep else ionic_energies
+                        energies[energy_name] = _parse_vasprun_float(line)
+            elif "<scstep>" in line:
+                in_scstep = True
+                scstep_energies = {}
+            elif "</scstep>" in line:
+                in_scstep = False
+                electronic_energies = scstep_energies
+            elif "</modeling>" in line:
+                is_complete = True
+
+    if not is_complete:
+        # e.g. the job was killed while writing it
+        raise ValueError(f"{vasprun_path} is incomplete")
+    if not all(name in ionic_energies for name in energy_names) or not all(
+        name in electronic_energies for name in energy_names
+    ):
+        raise ValueError(f"No final energy found in {vasprun_path}")
+    total_energy = ionic_energies["e_0_energy"]
+    total_energy_bugfix = np.round(
+        electronic_energies["e_0_energy"]
+        - electronic_energies["e_fr_energy"]
+        + ionic_energies["e_fr_energy"],
+        8,
+    )
+    if np.abs(total_energy - total_energy_bugfix) > 1e-7:
+        return float(total_energy_bugfix)
+    return total_energy
+
+
 def pcat(file_names):
     """
     Custom python-only replacement for cat
@@ -8,7 +8,7 @@ import shutil
 import stat
 import warnings
 from datetime import time, timedelta
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 import importlib_resources
@@ -18,14 +18,41 @@ from pymatgen.io.vasp import Poscar, Potcar
 
 from vasp_manager.utils import (
     LoggerAdapter,
-    change_directory,
     get_pmg_structure_from_poscar,
-    pcat,
 )
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _read_static_file(file_name):
+    """
+    Reads a file from static_files, only the first time it is needed
+
+    Args:
+        file_name (str): name of file in static_files
+    Returns:
+        file_text (str)
+    """
+    return (
+        importlib_resources.files("vasp_manager")
+        .joinpath(str(Path("static_files") / file_name))
+        .read_text()
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_static_json(file_name):
+    # the parsed lookup tables are shared by all instances and must not be
+    # modified
+    return json.loads(_read_static_file(file_name))
+
+
+@lru_cache(maxsize=None)
+def _load_static_yaml(file_name):
+    return yaml.load(_read_static_file(file_name), Loader=yaml.SafeLoader)
+
+
 class VaspInputCreator:
     """
     Handles VASP file creation
@@ -132,30 +159,15 @@ class VaspInputCreator:
 
     @cached_property
     def incar_template(self):
-        incar_template = (
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "INCAR_template"))
-            .read_text()
-        )
-        return incar_template
+        return _read_static_file("INCAR_template")
 
     @cached_property
     def potcar_dict(self):
-        potcar_dict = json.loads(
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "pot_dict.json"))
-            .read_text()
-        )
-        return potcar_dict
+        return _load_static_json("pot_dict.json")
 
     @cached_property
     def q_mapper(self):
-        q_mapper = json.loads(
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "q_handles.json"))
-            .read_text()
-        )
-        return q_mapper
+        return _load_static_json("q_handles.json")
 
     def make_poscar(self):
         """
@@ -186,9 +198,12 @@ class VaspInputCreator:
                 msg = f"Unable to create POTCAR\n\tPOTCAR not found at path {pot_single}"
                 raise Exception(msg)
 
-        potcar = pcat(pot_singles)
-        with open(potcar_path, "w+") as fw:
-            fw.write(potcar)
+        # stream the single-element POTCARs straight into the POTCAR rather
+        # than reading them all into memory first
+        with open(potcar_path, "wb") as fw:
+            for pot_single in pot_singles:
+                with open(pot_single, "rb") as fr:
+                    shutil.copyfileobj(fr, fw)
 
     @cached_property
     def n_nodes(self):
@@ -220,12 +235,7 @@ class VaspInputCreator:
 
     @cached_property
     def d_f_block(self):
-        d_f_block = json.loads(
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "d_f_block.json"))
-            .read_text()
-        )
-        return d_f_block
+        return _load_static_json("d_f_block.json")
 
     def _check_needs_spin_polarization(self, composition_dict):
         needs_spin_polarization = False
@@ -252,12 +262,7 @@ class VaspInputCreator:
 
     @cached_property
     def hubbards(self):
-        hubbards = json.loads(
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "hubbards.json"))
-            .read_text()
-        )
-        return hubbards
+        return _load_static_json("hubbards.json")
 
     def _check_needs_dftu(self, hubbards_type, composition_dict):
         if not hubbards_type:
@@ -472,12 +477,8 @@ class VaspInputCreator:
         )
 
         vaspq_settings_path = self.q_mapper[self.computer][mode]
-        vaspq_settings = yaml.load(
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / vaspq_settings_path))
-            .read_text(),
-            Loader=yaml.SafeLoader,
-        )
+        # copy as the cached settings are shared with other instances
+        vaspq_settings = _load_static_yaml(vaspq_settings_path).copy()
         override_vaspq_settings_path = self.config_dir / f"{self.computer}.yml"
         if override_vaspq_settings_path.exists():
             with open(override_vaspq_settings_path) as fr:
@@ -486,12 +487,7 @@ class VaspInputCreator:
                     Loader=yaml.SafeLoader,
                 )
             vaspq_settings.update(override_vaspq_settings)
-        vaspq_tmp = (
-            importlib_resources.files("vasp_manager")
-            .joinpath(str(Path("static_files") / "vasp.q"))
-            .read_text()
-        )
-        vaspq_tmp = vaspq_tmp.format(**vaspq_settings)
+        vaspq_tmp = _read_static_file("vasp.q").format(**vaspq_settings)
         vaspq = vaspq_tmp.format(**computing_config)
         self.logger.debug(vaspq)
         with open(vaspq_path, "w+") as fw:
@@ -502,42 +498,48 @@ class VaspInputCreator:
         """
         Make an archive of a VASP calculation and copy back over relevant files
         """
-        with change_directory(self.calc_path):
-            contcar_path = Path("CONTCAR")
-            contcar_exists = contcar_path.exists()
-            if contcar_exists:
-                contcar_is_empty = contcar_path.stat().st_size == 0
-            else:
-                contcar_is_empty = True
-
-            # if CONTCAR is empty, don't make an archive and clean up
-            if contcar_is_empty:
-                all_files = [
-                    f
-                    for f in Path(".").glob("*")
-                    if f.is_file() and "archive" not in f.name and "json" not in f.name
-                ]
-                for f in all_files:
+        # list calc_path once for the CONTCAR, the previous archives and the
+        # files to move
+        with os.scandir(self.calc_path) as calc_entries:
+            entries = list(calc_entries)
+        contcar_entry = next(
+            (entry for entry in entries if entry.name == "CONTCAR"), None
+        )
+        if contcar_entry is not None:
+            contcar_is_empty = contcar_entry.stat().st_size == 0
+        else:
+            contcar_is_empty = True
+        all_files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file()
+            and "archive" not in entry.name
+            and "json" not in entry.name
+        ]
+
+        # if CONTCAR is empty, don't make an archive and clean up
+        if contcar_is_empty:
+            for f in all_files:
+                os.remove(f)
+        # else, make the archive
+        else:
+            num_previous_archives = sum(
+                1 for entry in entries if entry.name.startswith("archive")
+            )
+            archive_name = f"archive_{num_previous_archives}"
+            archive_path = self.calc_path / archive_name
+            self.logger.info(f"Making {archive_name}...")
+            archive_path.mkdir()
+
+            for f in all_files:
+                # add if symlink for testing
+                if f.is_symlink():
+                    # relative links are relative to the directory of the link
+                    f_links_to = f.parent / f.readlink()
                     os.remove(f)
-            # else, make the archive
-            else:
-                num_previous_archives = len(list(Path(".").glob("archive*")))
-                archive_name = Path(f"archive_{num_previous_archives}")
-                self.logger.info(f"Making {archive_name}...")
-                archive_name.mkdir()
-
-                all_files = [
-                    f
-                    for f in Path(".").glob("*")
-                    if f.is_file() and "archive" not in f.name and "json" not in f.name
-                ]
-                for f in all_files:
-                    # add if symlink for testing
-                    if f.is_symlink():
-                        f_links_to = f.readlink()
-                        os.remove(f)
-                        shutil.copy2(f_links_to, f)
-                    shutil.move(f, archive_name)
+                    shutil.copy2(f_links_to, f)
+                # archive_path is inside calc_path, so this is always a rename
+                os.replace(f, archive_path / f.name)
 
         self.create()
 
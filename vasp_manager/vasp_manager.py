@@ -3,9 +3,12 @@
 
 import json
 import logging
-from functools import cached_property
-from importlib.metadata import version
-from multiprocessing import Pool
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from multiprocessing import get_all_start_methods, get_context
 from pathlib import Path
 
 import numpy as np
@@ -18,10 +21,32 @@ from vasp_manager.calculation_manager import (
     RlxCoarseCalculationManager,
     StaticCalculationManager,
 )
-from vasp_manager.utils import NumpyEncoder
+from vasp_manager.utils import (
+    NumpyEncoder,
+    _to_builtin,
+    get_n_atoms_from_poscar,
+    read_json,
+    write_json,
+)
 
 logger = logging.getLogger(__name__)
 
+# placeholder for calculation types that are missing from a material's results
+_MISSING = object()
+# supported calculation types in the order they need to be run
+_PROPER_ORDER = ("rlx-coarse", "rlx", "static", "bulkmod", "elastic")
+_ORDER_RANK = {calc_type: rank for rank, calc_type in enumerate(_PROPER_ORDER)}
+# calculation manager class for each calculation type
+_CALCULATION_MANAGERS = {
+    "rlx-coarse": RlxCoarseCalculationManager,
+    "rlx": RlxCalculationManager,
+    "static": StaticCalculationManager,
+    "bulkmod": BulkmodCalculationManager,
+    "elastic": ElasticCalculationManager,
+}
+# stored results of calculations that have not finished successfully
+_UNFINISHED_RESULTS = frozenset({None, "STOPPED", "not finished"})
+
 ASCII_LOGO = r"""
  __      __             __  __
  \ \    / /            |  \/  |
@@ -31,9 +56,20 @@ ASCII_LOGO = r"""
      \/ \__,_|___/ .__/|_|  |_|\__,_|_| |_|\__,_|\__, |\___|_|
                  | |                              __/ |
                  |_|                             |___/ v{}
-""".format(
-    version("vasp_manager")
-)
+"""
+
+
+@cache
+def _get_ascii_logo():
+    """
+    Formats ASCII_LOGO with the installed version, only looking up the
+    package metadata the first time the logo is needed
+    """
+    try:
+        vasp_manager_version = version("vasp_manager")
+    except PackageNotFoundError:
+        vasp_manager_version = "unknown"
+    return ASCII_LOGO.format(vasp_manager_version)
 
 
 class VaspManager:
@@ -56,6 +92,9 @@ class VaspManager:
         max_reruns=3,
         magmom_per_atom_cutoff=0.0,
         sort_by=str,
+        start_method=None,
+        compact_json=False,
+        executor="process",
     ):
         """
         Args:
@@ -68,9 +107,11 @@ class VaspManager:
                 if on personal computer
             tail (int): number of last lines from stdout.txt to log in debugging
                 if job failed
-            use_multiprocessing (bool): if True, use pool.map()
+            use_multiprocessing (bool): if True, manage materials concurrently
+                with {executor}
             ncore (int): if ncore, use {ncore} for multiprocessing
-                if None, defaults to minimum(number of materials, 4)
+                if None, defaults to minimum(number of materials, 4,
+                number of available cores)
             calculation_manager_kwargs (dict): contains subdictionaries for each
                 calculation type. Each subdictorary can be filled with extra kwargs
                 to pass to its associated CalculationManager during instantiation
@@ -82,8 +123,17 @@ class VaspManager:
                 magmom_per_atom less than this parameter will be automatically
                 rerun without spin-polarization
             sort_by (callable): function to sort the keys of the result dictionary
+            start_method (str): multiprocessing start method for the worker pool
+                if None, use "fork" on linux and the platform default elsewhere
+            compact_json (bool): if True, write results.json without indentation,
+                which makes it smaller and faster to read back
+            executor (str): "process" or "thread", whether to manage materials
+                with a process pool or a thread pool when use_multiprocessing
+                Managing a material is dominated by file I/O and job queue
+                calls, so a thread pool avoids starting and pickling to worker
+                processes
         """
-        print(ASCII_LOGO)
+        print(_get_ascii_logo())
         self.sort_by = sort_by
         self.calculation_types = calculation_types
         self.material_paths = material_paths
@@ -93,13 +143,22 @@ class VaspManager:
         self.tail = tail
         self.use_multiprocessing = use_multiprocessing
         self.ncore = ncore
+        self.start_method = start_method
+        self.executor = executor
         self.calculation_manager_kwargs = calculation_manager_kwargs
         self.max_reruns = max_reruns
         self.magmom_per_atom_cutoff = magmom_per_atom_cutoff
+        self.compact_json = compact_json
 
-        self.calculation_managers = self._get_all_calculation_managers()
+        # calculation managers are created on demand for each material
+        self._calculation_managers = {}
+        # (material name, calc_type) of from_scratch calculations that have
+        # already been removed, so later runs don't remove them again
+        self._reset_from_scratch = set()
         # self.base_path is set in material_paths.setter
         self.results_path = self.base_path / "results.json"
+        # (key, summary string) of the last string summary
+        self._summary_cache = None
         self.results = None
 
     @property
@@ -110,7 +169,15 @@ class VaspManager:
     def calculation_types(self, values):
         if not isinstance(values, list):
             raise TypeError("calculation_types must be a list")
-        self._calculation_types = values
+        unsupported_calc_types = set(values) - _ORDER_RANK.keys()
+        if unsupported_calc_types:
+            raise ValueError(f"Calc types {unsupported_calc_types} not supported")
+        if "elastic" in values and "rlx" not in values:
+            raise Exception("Cannot perform elastic calculation without mode='rlx' first")
+        # later calculations rely on earlier ones, so always run them in order
+        self._calculation_types = sorted(set(values), key=_ORDER_RANK.__getitem__)
+        # built on first use, as they depend on calculation_types
+        self._shared_manager_kwargs = None
 
     @property
     def ncore(self):
@@ -119,7 +186,13 @@ class VaspManager:
     @ncore.setter
     def ncore(self, value):
         if value is None:
-            value = int(np.min([len(self.material_paths), 4]))
+            # only count the cores this process may run on, e.g. within a SLURM
+            # allocation, rather than every core of the node
+            if hasattr(os, "sched_getaffinity"):
+                n_available_cores = len(os.sched_getaffinity(0))
+            else:
+                n_available_cores = os.cpu_count() or 1
+            value = min(len(self.material_paths), 4, n_available_cores)
             if self.use_multiprocessing:
                 print(
                     "WARNING: setting default ncore for multiprocessing to "
@@ -131,6 +204,29 @@ class VaspManager:
             raise Exception
         self._ncore = value
 
+    @property
+    def start_method(self):
+        return self._start_method
+
+    @start_method.setter
+    def start_method(self, value):
+        # fork starts workers much faster than spawn, but is only safe on linux
+        if value is None and sys.platform.startswith("linux"):
+            value = "fork"
+        if value is not None and value not in get_all_start_methods():
+            raise ValueError(f"start_method={value} is not supported on this platform")
+        self._start_method = value
+
+    @property
+    def executor(self):
+        return self._executor
+
+    @executor.setter
+    def executor(self, value):
+        if value not in ("process", "thread"):
+            raise ValueError(f"executor must be 'process' or 'thread', found {value}")
+        self._executor = value
+
     @property
     def calculation_manager_kwargs(self):
         return self._calculation_manager_kwargs
@@ -140,6 +236,8 @@ class VaspManager:
         if not isinstance(values, dict):
             raise TypeError("calculation_manager_kwargs must be a dictionary")
 
+        # copy so the caller's dict (or the shared default) is never modified
+        values = {calc_type: dict(kwargs) for calc_type, kwargs in values.items()}
         supported_kwargs = ["primitive", "from_scratch", "strains"]
         for calc_type in self.calculation_types:
             if calc_type not in values:
@@ -171,9 +269,11 @@ class VaspManager:
         """
         match values:
             case str():
-                self.base_path = values
-                material_paths = [d for d in Path(values).glob("*") if d.is_dir()]
-            case list() | np.array():
+                self.base_path = Path(values)
+                # DirEntry.is_dir() reuses the file type from the directory listing
+                with os.scandir(values) as entries:
+                    material_paths = [Path(e.path) for e in entries if e.is_dir()]
+            case list() | np.ndarray():
                 values = [Path(p) for p in values]
                 base_path = values[0].parent
                 for mat_path in values:
@@ -188,14 +288,23 @@ class VaspManager:
                     "material_paths must be a directory name or a list of paths"
                 )
         # Sort the paths by name
-        self._material_paths = sorted(material_paths, key=lambda x: self.sort_by(x.name))
-
-    def _get_material_name_from_path(self, material_path):
-        return material_path.name
+        material_paths.sort(key=lambda x: self.sort_by(x.name))
+        self._material_paths = material_paths
+        self._material_names = [mpath.name for mpath in self._material_paths]
+        self._material_paths_by_name = dict(
+            zip(self._material_names, self._material_paths)
+        )
 
-    @cached_property
+    @property
     def material_names(self):
-        return [self._get_material_name_from_path(mpath) for mpath in self.material_paths]
+        return self._material_names
+
+    @property
+    def calculation_managers(self):
+        """
+        Calculation managers for all materials, created on first access
+        """
+        return self._get_all_calculation_managers()
 
     @property
     def results(self):
@@ -204,17 +313,56 @@ class VaspManager:
     @results.setter
     def results(self, value):
         if value is None:
+            # names of materials whose results differ from results.json
+            self._dirty = set()
+            # version of results.json when it was last read or written
+            self._results_file_key = None
             if self.results_path.exists():
-                with open(self.results_path, "r") as fr:
-                    self._results = json.load(fr)
+                self._results_file_key = self._get_results_file_key()
+                loaded_results = read_json(self.results_path)
+                # material_names is already sorted by sort_by, so merging in its
+                # order keeps the results sorted without sorting them again
+                self._results = {}
                 for mat_name in self.material_names:
-                    if mat_name not in self._results:
+                    if mat_name in loaded_results:
+                        self._results[mat_name] = loaded_results.pop(mat_name)
+                    else:
                         self._results[mat_name] = {}
-                self._results = dict(
-                    sorted(self._results.items(), key=lambda kv: self.sort_by(kv[0]))
-                )
+                        self._dirty.add(mat_name)
+                # keep results of materials that aren't in material_paths
+                if loaded_results:
+                    self._results.update(loaded_results)
+                    self._results = dict(
+                        sorted(self._results.items(), key=lambda kv: self.sort_by(kv[0]))
+                    )
             else:
                 self._results = {mat_name: {} for mat_name in self.material_names}
+                self._dirty = set(self.material_names)
+
+    def refresh_results(self):
+        """
+        Reloads results from results.json, discarding any results that
+        haven't been written yet
+
+        Returns:
+            results (dict): results of all materials
+        """
+        self.results = None
+        return self.results
+
+    def _get_results_file_key(self):
+        """
+        Identifies the version of results.json on disk
+
+        Every write replaces results.json with a new file, so the inode and size
+        tell versions apart even on filesystems with coarse modification times
+
+        Returns:
+            results_file_key (tuple[int]): inode, size, and modification time
+                of results.json
+        """
+        results_stat = self.results_path.stat()
+        return (results_stat.st_ino, results_stat.st_size, results_stat.st_mtime_ns)
 
     def _check_calc_by_result(self, material_name, calc_type):
         """
@@ -226,131 +374,167 @@ class VaspManager:
         Returns:
             (is_done (bool), is_stopped (bool))
         """
-        match calc_type:
-            case "rlx-coarse" | "rlx" | "static" | "bulkmod" | "elastic":
-                is_done = self.results[material_name][calc_type] not in [
-                    None,
-                    "STOPPED",
-                    "not finished",
-                ]
-                is_stopped = self.results[material_name][calc_type] == "STOPPED"
-            case _:
-                raise ValueError("Can't find mode {mode} in result")
+        if calc_type not in _ORDER_RANK:
+            raise ValueError(f"Can't find mode {calc_type} in result")
+        return self._get_status_from_result(self.results[material_name][calc_type])
+
+    @staticmethod
+    def _get_status_from_result(result):
+        """
+        Checks if a single calculation result is done or stopped
+
+        Args:
+            result (str | dict | None): stored result of a calculation
+        Returns:
+            (is_done (bool), is_stopped (bool))
+        """
+        # results of finished calculations are usually dicts, which aren't hashable
+        is_done = isinstance(result, dict) or result not in _UNFINISHED_RESULTS
+        is_stopped = result == "STOPPED"
         return (is_done, is_stopped)
 
-    def _get_calculation_managers(self, material_path):
+    def _get_calculation_managers(self, material_path, calculation_types=None):
         """
         Gets calculation managers for a single material
+
+        Args:
+            material_path (Path): path of the material
+            calculation_types (list[str]): calculation types to create managers
+                for, in the order they need to be run
+                if None, create managers for all of self.calculation_types
+        Returns:
+            calc_managers (list[BaseCalculationManager])
         """
+        if calculation_types is None:
+            calculation_types = self.calculation_types
+        material_name = material_path.name
         calc_managers = []
-        for calc_type in self.calculation_types:
-            match calc_type:
-                case "rlx-coarse":
-                    manager = RlxCoarseCalculationManager(
-                        material_path=material_path,
-                        to_rerun=self.to_rerun,
-                        to_submit=self.to_submit,
-                        ignore_personal_errors=self.ignore_personal_errors,
-                        tail=self.tail,
-                        max_reruns=self.max_reruns,
-                        **self.calculation_manager_kwargs[calc_type],
-                    )
-                case "rlx":
-                    from_coarse_relax = "rlx-coarse" in self.calculation_types
-                    manager = RlxCalculationManager(
-                        material_path=material_path,
-                        to_rerun=self.to_rerun,
-                        to_submit=self.to_submit,
-                        ignore_personal_errors=self.ignore_personal_errors,
-                        from_coarse_relax=from_coarse_relax,
-                        tail=self.tail,
-                        max_reruns=self.max_reruns,
-                        magmom_per_atom_cutoff=self.magmom_per_atom_cutoff,
-                        **self.calculation_manager_kwargs[calc_type],
-                    )
-                case "static":
-                    from_relax = "rlx" in self.calculation_types
-                    manager = StaticCalculationManager(
-                        material_path=material_path,
-                        to_rerun=self.to_rerun,
-                        to_submit=self.to_submit,
-                        ignore_personal_errors=self.ignore_personal_errors,
-                        from_relax=from_relax,
-                        tail=self.tail,
-                        **self.calculation_manager_kwargs[calc_type],
-                    )
-                case "bulkmod":
-                    from_relax = "rlx" in self.calculation_types
-                    manager = BulkmodCalculationManager(
-                        material_path=material_path,
-                        to_rerun=self.to_rerun,
-                        to_submit=self.to_submit,
-                        ignore_personal_errors=self.ignore_personal_errors,
-                        from_relax=from_relax,
-                        **self.calculation_manager_kwargs[calc_type],
-                    )
-                case "elastic":
-                    if "rlx" not in self.calculation_types:
-                        msg = (
-                            "Cannot perform elastic calculation without mode='rlx'"
-                            " first"
-                        )
-                        raise Exception(msg)
-                    manager = ElasticCalculationManager(
-                        material_path=material_path,
-                        to_rerun=self.to_rerun,
-                        to_submit=self.to_submit,
-                        ignore_personal_errors=self.ignore_personal_errors,
-                        tail=self.tail,
-                        **self.calculation_manager_kwargs[calc_type],
-                    )
-                case _:
-                    raise Exception(f"Calc type {calc_type} not supported")
-
+        for calc_type in calculation_types:
+            manager_kwargs = self.calculation_manager_kwargs[calc_type]
+            if not self._restarts_from_scratch(material_name, calc_type):
+                manager_kwargs = {**manager_kwargs, "from_scratch": False}
+            manager = _CALCULATION_MANAGERS[calc_type](
+                material_path=material_path,
+                **self._get_shared_manager_kwargs(calc_type),
+                **manager_kwargs,
+            )
+            if manager.from_scratch:
+                self._reset_from_scratch.add((material_name, calc_type))
             calc_managers.append(manager)
         return calc_managers
 
+    def _get_shared_manager_kwargs(self, calc_type):
+        """
+        Gets the kwargs of a calculation type's managers that are the same for
+        every material, building them once for the current calculation_types
+
+        Args:
+            calc_type (str): calculation type of the manager
+        Returns:
+            shared_kwargs (dict): kwargs for the calculation manager, apart from
+                material_path and calculation_manager_kwargs
+        """
+        if self._shared_manager_kwargs is None:
+            common_kwargs = {
+                "to_rerun": self.to_rerun,
+                "to_submit": self.to_submit,
+                "ignore_personal_errors": self.ignore_personal_errors,
+            }
+            from_relax = "rlx" in self.calculation_types
+            # bulkmod managers are left to their own default tail
+            extra_kwargs = {
+                "rlx-coarse": {"tail": self.tail, "max_reruns": self.max_reruns},
+                "rlx": {
+                    "from_coarse_relax": "rlx-coarse" in self.calculation_types,
+                    "tail": self.tail,
+                    "max_reruns": self.max_reruns,
+                    "magmom_per_atom_cutoff": self.magmom_per_atom_cutoff,
+                },
+                "static": {"from_relax": from_relax, "tail": self.tail},
+                "bulkmod": {"from_relax": from_relax},
+                "elastic": {"tail": self.tail},
+            }
+            self._shared_manager_kwargs = {
+                calc_type: {**common_kwargs, **extra_kwargs[calc_type]}
+                for calc_type in self.calculation_types
+            }
+        return self._shared_manager_kwargs[calc_type]
+
+    def _restarts_from_scratch(self, material_name, calc_type):
+        """
+        Checks if a calculation still needs to be removed and restarted
+
+        Args:
+            material_name (str): name of material to check
+            calc_type (str): calculation type to check
+        Returns:
+            restarts_from_scratch (bool): True if the calculation is from_scratch
+                and hasn't been removed yet by this VaspManager
+        """
+        if not self.calculation_manager_kwargs[calc_type].get("from_scratch"):
+            return False
+        return (material_name, calc_type) not in self._reset_from_scratch
+
+    def _get_calculation_managers_by_name(self, material_name):
+        """
+        Gets calculation managers for a single material, creating them only
+        the first time they are needed
+        """
+        if material_name not in self._calculation_managers:
+            material_path = self._material_paths_by_name[material_name]
+            self._calculation_managers[material_name] = self._get_calculation_managers(
+                material_path
+            )
+        return self._calculation_managers[material_name]
+
     def _get_all_calculation_managers(self):
         """
         Gets calculation managers for all materials
         """
         calc_managers = {}
-        for material_name, material_path in zip(self.material_names, self.material_paths):
-            calc_managers[material_name] = self._get_calculation_managers(material_path)
+        for material_name in self.material_names:
+            calc_managers[material_name] = self._get_calculation_managers_by_name(
+                material_name
+            )
         return calc_managers
 
     def _manage_calculations(self, material_name):
         """
         Runs vasp job workflow for a single material
         """
+        mat_results = self.results.get(material_name, {})
+        calc_managers = self._calculation_managers.get(material_name)
+        if calc_managers is None:
+            # only create managers for calculations that still need to be managed
+            calc_managers = self._get_calculation_managers(
+                self._material_paths_by_name[material_name],
+                self._get_pending_calculation_types(material_name),
+            )
         material_results = {}
-        for calc_manager in self.calculation_managers[material_name]:
-            if calc_manager.mode in self.results[material_name].keys():
-                calc_is_done, calc_is_stopped = self._check_calc_by_result(
-                    material_name, calc_manager.mode
-                )
+        for calc_manager in calc_managers:
+            mode = calc_manager.mode
+            if mode in mat_results:
+                calc_is_done, _ = self._check_calc_by_result(material_name, mode)
                 if calc_is_done and not calc_manager.from_scratch:
-                    logger.info(
-                        f"{material_name} -- {calc_manager.mode.upper()} Successful"
-                    )
+                    logger.info("%s -- %s Successful", material_name, mode.upper())
                     continue
 
             if calc_manager.stopped:
-                logger.info(f"{material_name} -- {calc_manager.mode.upper()} STOPPED")
-                material_results[calc_manager.mode] = "STOPPED"
+                logger.info("%s -- %s STOPPED", material_name, mode.upper())
+                material_results[mode] = "STOPPED"
                 break
 
             if not calc_manager.job_exists:
-                logger.info(f"{material_name} -- Setting up {calc_manager.mode.upper()}")
+                logger.info("%s -- Setting up %s", material_name, mode.upper())
                 calc_manager.setup_calc()
-                match calc_manager.mode:
+                match mode:
                     case "rlx-coarse" | "rlx":
                         break
                     case _:
                         pass
 
             if not calc_manager.is_done:
-                match calc_manager.mode:
+                match mode:
                     case "rlx-coarse" | "rlx" | "elastic":
                         # don't check further modes as they rely on rlx-coarse
                         # or rlx to be done
@@ -361,19 +545,141 @@ class VaspManager:
                         # independent of each other
                         pass
 
-            material_results[calc_manager.mode] = calc_manager.results
+            material_results[mode] = calc_manager.results
         return (material_name, material_results)
 
+    def _get_pending_calculation_types(self, material_name):
+        """
+        Gets the calculation types of a material that still need to be managed
+
+        Args:
+            material_name (str): name of material to check
+        Returns:
+            pending_calc_types (list[str]): calculation types that aren't done
+                according to the results or that still restart from scratch
+        """
+        mat_results = self.results[material_name]
+        pending_calc_types = []
+        for calc_type in self.calculation_types:
+            if self._restarts_from_scratch(material_name, calc_type):
+                pending_calc_types.append(calc_type)
+                continue
+            if calc_type not in mat_results:
+                pending_calc_types.append(calc_type)
+                continue
+            calc_is_done, _ = self._check_calc_by_result(material_name, calc_type)
+            if not calc_is_done:
+                pending_calc_types.append(calc_type)
+        return pending_calc_types
+
+    def _needs_calculations(self, material_name):
+        """
+        Checks if any calculation of a material still needs to be managed
+
+        Args:
+            material_name (str): name of material to check
+        Returns:
+            needs_calculations (bool): if False, every calculation is already
+                done according to the results and doesn't restart from scratch
+        """
+        return len(self._get_pending_calculation_types(material_name)) != 0
+
+    def _get_n_atoms(self, material_name):
+        """
+        Gets the number of atoms of a material, as an estimate of how long its
+        calculations take
+
+        Args:
+            material_name (str): name of material
+        Returns:
+            n_atoms (int): number of atoms in the material's POSCAR, or 0 if it
+                can't be read
+        """
+        poscar_path = self._material_paths_by_name[material_name] / "POSCAR"
+        try:
+            return get_n_atoms_from_poscar(poscar_path)
+        except (OSError, IndexError, ValueError):
+            return 0
+
+    def _get_dispatch_order(self, material_names, chunksize=1):
+        """
+        Orders materials so the largest are started first when they are sent
+        to the workers in consecutive chunks
+
+        Args:
+            material_names (list[str]): names of materials to dispatch
+            chunksize (int): number of consecutive materials sent to a worker
+                at once
+        Returns:
+            ordered_names (list[str]): material_names in dispatch order
+        """
+        # start the largest materials first so they don't hold up the end of
+        # the run while the other workers sit idle
+        by_size = sorted(material_names, key=self._get_n_atoms, reverse=True)
+        if chunksize == 1 or len(by_size) <= chunksize:
+            return by_size
+        # a worker runs the materials of a chunk one after another, so deal the
+        # materials out across the chunks instead of giving the largest ones
+        # all to the first chunk
+        n_chunks = -(-len(by_size) // chunksize)
+        last_chunk_size = len(by_size) - chunksize * (n_chunks - 1)
+        # deal to every chunk until the last one is full, then to the others
+        n_dealt_to_all = last_chunk_size * n_chunks
+        chunks = [[] for _ in range(n_chunks)]
+        for rank, material_name in enumerate(by_size):
+            if rank < n_dealt_to_all:
+                chunks[rank % n_chunks].append(material_name)
+            else:
+                chunks[(rank - n_dealt_to_all) % (n_chunks - 1)].append(material_name)
+        return [material_name for chunk in chunks for material_name in chunk]
+
     def _manage_calculations_wrapper(self):
-        if self.use_multiprocessing:
-            with Pool(self.ncore) as pool:
-                results = pool.map(
-                    self._manage_calculations, tqdm(self.material_names), 1
+        # don't dispatch materials that are already finished
+        material_names = [
+            material_name
+            for material_name in self.material_names
+            if self._needs_calculations(material_name)
+        ]
+        n_finished = len(self.material_names) - len(material_names)
+        if n_finished != 0:
+            logger.info("Skipping %d materials with finished calculations", n_finished)
+
+        if self.use_multiprocessing and self.executor == "thread":
+            material_names = self._get_dispatch_order(material_names)
+            with ThreadPoolExecutor(self.ncore) as executor:
+                futures = [
+                    executor.submit(self._manage_calculations, material_name)
+                    for material_name in material_names
+                ]
+                results = [
+                    future.result()
+                    for future in tqdm(as_completed(futures), total=len(futures))
+                ]
+        elif self.use_multiprocessing:
+            # send materials to the workers in a few chunks per worker
+            chunksize = max(1, len(material_names) // (self.ncore * 4))
+            material_names = self._get_dispatch_order(material_names, chunksize)
+            with get_context(self.start_method).Pool(self.ncore) as pool:
+                # collect results as they finish so the progress bar tracks
+                # completed materials rather than dispatched ones
+                results = list(
+                    tqdm(
+                        pool.imap_unordered(
+                            self._manage_calculations, material_names, chunksize
+                        ),
+                        total=len(material_names),
+                    )
                 )
+            # managers created in the workers are discarded with them, so record
+            # the from_scratch calculations they restarted here
+            for material_name in material_names:
+                for calc_type in self.calculation_types:
+                    if self._restarts_from_scratch(material_name, calc_type):
+                        self._reset_from_scratch.add((material_name, calc_type))
         else:
             results = []
-            for i, material_name in enumerate(self.material_names):
-                print(f"{i+1}/{len(self.material_names)} -- {material_name}", flush=True)
+            for i, material_name in enumerate(material_names):
+                print(f"{i+1}/{len(material_names)} -- {material_name}", flush=True)
                 results.append(self._manage_calculations(material_name))
                 print()
         return results
@@ -383,16 +689,40 @@ class VaspManager:
         Runs vasp job workflow for all materials
         """
         results = self._manage_calculations_wrapper()
+        all_results = self.results
         for material_name, material_result in results:
-            self.results[material_name].update(material_result)
-
-        json_str = json.dumps(self.results, indent=2, cls=NumpyEncoder)
-        logger.debug(json_str)
-        with open(self.results_path, "w+") as fw:
-            fw.write(json_str)
-        print(f"Dumped to {self.results_path}")
+            mat_results = all_results.setdefault(material_name, {})
+            for calc_type, calc_result in material_result.items():
+                # unfinished calculations return the same result on every run,
+                # so only mark the material if a result actually changed
+                calc_result = _to_builtin(calc_result)
+                if calc_type not in mat_results or mat_results[calc_type] != calc_result:
+                    mat_results[calc_type] = calc_result
+                    self._dirty.add(material_name)
+
+        if self._dirty or not self.results_path.exists():
+            self._write_results()
+            print(f"Dumped to {self.results_path}")
+        else:
+            print(f"No new results to dump to {self.results_path}")
         return self.results
 
+    def _write_results(self):
+        """
+        Atomically writes results to results.json
+
+        The results are first written to a temporary file in the same directory,
+        which then replaces results.json so an interrupted write never leaves a
+        truncated results.json behind
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(json.dumps(self.results, indent=2, cls=NumpyEncoder))
+        tmp_path = self.results_path.with_name(f"{self.results_path.name}.tmp")
+        write_json(self.results, tmp_path, compact=self.compact_json)
+        os.replace(tmp_path, self.results_path)
+        self._dirty.clear()
+        self._results_file_key = self._get_results_file_key()
+
     def summary(self, as_string=True, print_unfinished=False, print_stopped=True):
         """
         Create a string summary of all calculations
@@ -404,52 +734,81 @@ class VaspManager:
         """
         if not self.results_path.exists():
             raise ValueError(f"Can't find results in {self.results_path}")
-        with open(self.results_path) as fr:
-            results = json.load(fr)
+        # self.results mirrors results.json unless it has been rewritten since
+        # it was last read or written, e.g. by another process
+        if self._get_results_file_key() != self._results_file_key:
+            self.refresh_results()
+        results = self.results
+
+        # string summaries only change when results.json does, so reuse the last
+        # one if nothing has been read or written since
+        summary_key = (
+            self._results_file_key,
+            tuple(self.calculation_types),
+            print_unfinished,
+            print_stopped,
+        )
+        if as_string and self._summary_cache is not None:
+            cached_key, cached_summary_str = self._summary_cache
+            if cached_key == summary_key:
+                return cached_summary_str
 
         summary_dict = {}
         summary_dict["n_total"] = len(results)
+        # hold direct references to each calc_type's lists for the loop below
+        buckets = {}
         for calc_type in self.calculation_types:
             summary_dict[calc_type] = {}
             summary_dict[calc_type]["n_finished"] = 0
             summary_dict[calc_type]["finished"] = []
             summary_dict[calc_type]["unfinished"] = []
             summary_dict[calc_type]["stopped"] = []
-
-            for material, mat_results in results.items():
+            buckets[calc_type] = (
+                summary_dict[calc_type]["finished"],
+                summary_dict[calc_type]["unfinished"],
+                summary_dict[calc_type]["stopped"],
+            )
+
+        # classify every (material, calc_type) pair in a single pass over results
+        get_status_from_result = self._get_status_from_result
+        for material, mat_results in results.items():
+            for calc_type, (finished, unfinished, stopped) in buckets.items():
+                result = mat_results.get(calc_type, _MISSING)
                 # need to account for case key doesn't yet exist
-                if calc_type not in mat_results:
-                    summary_dict[calc_type]["unfinished"].append(material)
+                if result is _MISSING:
+                    unfinished.append(material)
+                    continue
+                is_done, is_stopped = get_status_from_result(result)
+                if is_done:
+                    finished.append(material)
                 else:
-                    is_done, is_stopped = self._check_calc_by_result(material, calc_type)
-                    if is_done:
-                        summary_dict[calc_type]["n_finished"] += 1
-                        summary_dict[calc_type]["finished"].append(material)
-                    else:
-                        if is_stopped:
-                            summary_dict[calc_type]["stopped"].append(material)
-                        summary_dict[calc_type]["unfinished"].append(material)
+                    if is_stopped:
+                        stopped.append(material)
+                    unfinished.append(material)
+
+        for calc_type, (finished, _, _) in buckets.items():
+            summary_dict[calc_type]["n_finished"] = len(finished)
 
         if as_string:
             n_materials = summary_dict["n_total"]
-            summary_str = ""
-            summary_str += f"Total Materials = {n_materials}\n"
-            summary_str += "-" * 30 + "\n"
+            summary_lines = [f"Total Materials = {n_materials}", "-" * 30]
             for calc_type in self.calculation_types:
                 name = calc_type.upper()
                 n_finished = summary_dict[calc_type]["n_finished"]
-                summary_str += f"{name: <12}{n_finished}/{n_materials} completed\n"
+                summary_lines.append(f"{name: <12}{n_finished}/{n_materials} completed")
                 if print_unfinished:
                     unfinished = summary_dict[calc_type]["unfinished"]
                     if len(unfinished) != 0:
-                        summary_str += (
-                            " " * 12 + f"{n_materials - n_finished} not completed\n"
+                        summary_lines.append(
+                            " " * 12 + f"{n_materials - n_finished} not completed"
                         )
-                        summary_str += f"Unfinished {calc_type.upper()}: {unfinished}\n"
+                        summary_lines.append(f"Unfinished {name}: {unfinished}")
                 if print_stopped:
                     stopped = summary_dict[calc_type]["stopped"]
                     if len(stopped) != 0:
-                        summary_str += f"\tStopped {calc_type.upper()}: {stopped}\n"
+                        summary_lines.append(f"\tStopped {name}: {stopped}")
+            summary_str = "\n".join(summary_lines) + "\n"
+            self._summary_cache = (summary_key, summary_str)
             return summary_str
         else:
             return summary_dict